@@ -1,6 +1,6 @@
 """Unit conversion utilities for calculator."""
 
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 
 class UnitConverter:
@@ -31,6 +31,16 @@ class UnitConverter:
     # Temperature conversions (special handling)
     TEMP_UNITS = ['c', 'f', 'k']
     
+    # Temperature as (scale, offset) to Celsius: celsius = value * scale + offset
+    TEMP_TO_CELSIUS: Dict[str, Tuple[float, float]] = {
+        'c': (1.0, 0.0),
+        'f': (5/9, -160/9),
+        'k': (1.0, -273.15)
+    }
+    
+    # Per (category, from_unit) conversion vectors, built on first use
+    _vectors: Dict[Tuple[str, str], Tuple[List[str], List[float], List[float]]] = {}
+    
     @classmethod
     def convert_length(cls, value: float, from_unit: str, to_unit: str) -> float:
         """Convert length units."""
@@ -121,6 +131,47 @@ class UnitConverter:
         else:
             raise ValueError("Cannot convert between different unit types")
     
+    @classmethod
+    def conversion_vectors(cls, category: str, from_unit: str) -> Tuple[List[str], List[float], List[float]]:
+        """
+        Get target units with scale and offset vectors for a source unit.
+        
+        Converting ``value`` into ``units[i]`` is ``value * scales[i] + offsets[i]``.
+        Vectors are computed once per category and source unit.
+        """
+        key = (category, from_unit.lower())
+        vectors = cls._vectors.get(key)
+        if vectors is not None:
+            return vectors
+        
+        # Each unit as (scale, offset) relative to the category base unit
+        if category == 'length':
+            base = {unit: (factor, 0.0) for unit, factor in cls.LENGTH_UNITS.items()}
+        elif category == 'weight':
+            base = {unit: (factor, 0.0) for unit, factor in cls.WEIGHT_UNITS.items()}
+        elif category == 'temperature':
+            base = cls.TEMP_TO_CELSIUS
+        else:
+            raise ValueError(f"Unsupported category. Supported: {list(cls.get_supported_units().keys())}")
+        
+        if key[1] not in base:
+            raise ValueError(f"Unsupported {category} unit. Supported: {list(base.keys())}")
+        
+        from_scale, from_offset = base[key[1]]
+        units = list(base.keys())
+        scales = [from_scale / base[unit][0] for unit in units]
+        offsets = [(from_offset - base[unit][1]) / base[unit][0] for unit in units]
+        
+        vectors = (units, scales, offsets)
+        cls._vectors[key] = vectors
+        return vectors
+    
+    @classmethod
+    def convert_all(cls, value: float, category: str, from_unit: str) -> List[Tuple[str, float]]:
+        """Convert a value into every unit of its category in one pass."""
+        units, scales, offsets = cls.conversion_vectors(category, from_unit)
+        return [(unit, value * scale + offset) for unit, scale, offset in zip(units, scales, offsets)]
+    
     @classmethod
     def get_supported_units(cls) -> Dict[str, list]:
         """Get all supported units by category."""
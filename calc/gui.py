@@ -1,15 +1,47 @@
 """GUI calculator application using tkinter."""
 
+import multiprocessing
+import time
 import tkinter as tk
 from tkinter import font, ttk
 from typing import Optional
 from .converter import UnitConverter
 
+# Seconds an expression may run before it is abandoned
+EVAL_TIME_BUDGET = 5.0
+# How often the main loop checks for a finished evaluation
+EVAL_POLL_MS = 20
+# Delay after the last keystroke before the conversion table refreshes
+CONVERT_DEBOUNCE_MS = 150
+
+
+def _evaluate_expression(expression: str) -> str:
+    """Evaluate an expression and return the display text."""
+    try:
+        result = eval(expression)
+        
+        # Format result
+        if isinstance(result, float) and result.is_integer():
+            return str(int(result))
+        return str(result)
+    except Exception:
+        return "Error"
+
+
+def _evaluation_worker(conn):
+    """Evaluate expressions received on conn until the GUI closes it."""
+    while True:
+        try:
+            expression = conn.recv()
+        except (EOFError, OSError):
+            return
+        conn.send(_evaluate_expression(expression))
+
 
 class CalculatorGUI:
     """GUI calculator with tkinter interface."""
     
-    def __init__(self):
+    def __init__(self, time_budget: float = EVAL_TIME_BUDGET):
         self.window = tk.Tk()
         self.window.title("Calculator")
         self.window.resizable(False, False)
@@ -18,14 +50,30 @@ class CalculatorGUI:
         self.current_input = ""
         self.result_var = tk.StringVar()
         self.result_var.set("0")
+        self.status_var = tk.StringVar()
         self.conversion_mode = False
         
+        # Background evaluation state
+        self.time_budget = time_budget
+        self._eval_process: Optional[multiprocessing.Process] = None
+        self._eval_conn = None
+        self._eval_busy = False
+        self._eval_started = 0.0
+        self._eval_job = 0
+        
+        # Live conversion table state
+        self._table_rows = []
+        self._table_after_id = None
+        
         # Create GUI components
         self._create_conversion_tab()
         self._create_buttons()
         
         # Bind keyboard events
         self._bind_keyboard()
+        
+        # Start the evaluation worker ahead of the first calculation
+        self._start_worker()
     
     def _create_conversion_tab(self):
         """Create unit conversion interface."""
@@ -52,6 +100,17 @@ class CalculatorGUI:
     
     def _update_display_for_tab(self):
         """Update display to work with tab system."""
+        # Busy indicator
+        status_label = tk.Label(
+            self.display_frame,
+            textvariable=self.status_var,
+            font=("Arial", 10),
+            bg="black",
+            fg="#a0a0a0",
+            anchor="e"
+        )
+        status_label.pack(fill="x")
+        
         # Result label
         result_font = font.Font(family="Arial", size=24, weight="bold")
         result_label = tk.Label(
@@ -101,6 +160,12 @@ class CalculatorGUI:
                                font=("Arial", 14, "bold"), bg="white")
         result_label.grid(row=5, column=0, columnspan=2, padx=5, pady=5)
         
+        # Live table of the value in every unit of the category
+        self.conv_table = tk.Frame(parent)
+        self.conv_table.grid(row=6, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.conv_value.bind('<KeyRelease>', self._schedule_table_update)
+        self.conv_from.bind('<<ComboboxSelected>>', self._schedule_table_update)
+        
         # Initialize unit options
         self._update_unit_options()
     
@@ -116,6 +181,54 @@ class CalculatorGUI:
             if unit_list:
                 self.conv_from.set(unit_list[0])
                 self.conv_to.set(unit_list[1] if len(unit_list) > 1 else unit_list[0])
+        
+        self._update_conversion_table()
+    
+    def _schedule_table_update(self, event=None):
+        """Refresh the conversion table once typing pauses."""
+        if self._table_after_id is not None:
+            self.window.after_cancel(self._table_after_id)
+        self._table_after_id = self.window.after(CONVERT_DEBOUNCE_MS, self._update_conversion_table)
+    
+    def _update_conversion_table(self):
+        """Show the input value converted into every unit of the category."""
+        self._table_after_id = None
+        
+        try:
+            value = float(self.conv_value.get())
+            results = UnitConverter.convert_all(value, self.conv_category.get(), self.conv_from.get())
+        except ValueError:
+            results = []
+        
+        # Add rows only when a category needs more than exist
+        while len(self._table_rows) < len(results):
+            unit_var = tk.StringVar()
+            value_var = tk.StringVar()
+            index = len(self._table_rows)
+            unit_label = tk.Label(self.conv_table, textvariable=unit_var, font=("Arial", 11), anchor="w")
+            value_label = tk.Label(self.conv_table, textvariable=value_var, font=("Arial", 11), anchor="e")
+            unit_label.grid(row=index, column=0, sticky="w", padx=5)
+            value_label.grid(row=index, column=1, sticky="e", padx=5)
+            self._table_rows.append((unit_var, value_var, unit_label, value_label))
+        
+        for index, (unit_var, value_var, unit_label, value_label) in enumerate(self._table_rows):
+            if index < len(results):
+                unit, result = results[index]
+                unit_var.set(unit)
+                value_var.set(self._format_table_value(result))
+                unit_label.grid()
+                value_label.grid()
+            else:
+                unit_label.grid_remove()
+                value_label.grid_remove()
+    
+    @staticmethod
+    def _format_table_value(result: float) -> str:
+        """Format a converted value for the conversion table."""
+        result = round(result, 10)
+        if result.is_integer():
+            return str(int(result))
+        return f"{result:.4f}"
     
     def _perform_conversion(self):
         """Perform unit conversion."""
@@ -209,9 +322,15 @@ class CalculatorGUI:
             self._button_click("multiply")
         elif key == '/':
             self._button_click("divide")
+        elif key in ('c', 'C'):
+            self._button_click("clear")
     
     def _button_click(self, action: str):
         """Handle button clicks."""
+        # Only clearing is allowed while an evaluation is running
+        if self._eval_busy and action != "clear":
+            return
+        
         try:
             if action.isdigit():
                 self._append_digit(action)
@@ -247,7 +366,8 @@ class CalculatorGUI:
             self.result_var.set(current + ".")
     
     def _clear(self):
-        """Clear the display."""
+        """Clear the display, cancelling any running evaluation."""
+        self._cancel_evaluation()
         self.result_var.set("0")
     
     def _backspace(self):
@@ -289,25 +409,87 @@ class CalculatorGUI:
             self.result_var.set(current + f" {operator_symbols[operator]} ")
     
     def _calculate(self):
-        """Perform the calculation."""
+        """Send the expression to the worker process for evaluation."""
+        expression = self.result_var.get()
+        # Replace display symbols with Python operators
+        expression = expression.replace("×", "*").replace("÷", "/")
+        
+        self._cancel_evaluation()
+        if self._eval_process is None or not self._eval_process.is_alive():
+            self._stop_worker()
+            self._start_worker()
+        self._eval_conn.send(expression)
+        self._eval_busy = True
+        self._eval_started = time.monotonic()
+        self._eval_job += 1
+        
+        self.status_var.set("Calculating... (Esc to cancel)")
+        self.window.config(cursor="watch")
+        self.window.after(EVAL_POLL_MS, self._poll_evaluation, self._eval_job)
+    
+    def _poll_evaluation(self, job: int):
+        """Check the worker for a result without blocking the main loop."""
+        if not self._eval_busy or job != self._eval_job:
+            return
+        
         try:
-            expression = self.result_var.get()
-            # Replace display symbols with Python operators
-            expression = expression.replace("×", "*").replace("÷", "/")
-            
-            result = eval(expression)
-            
-            # Format result
-            if isinstance(result, float) and result.is_integer():
-                self.result_var.set(str(int(result)))
-            else:
-                self.result_var.set(str(result))
-        except Exception:
+            if self._eval_conn.poll():
+                text = self._eval_conn.recv()
+                self._finish_evaluation()
+                self.result_var.set(text)
+                return
+        except (EOFError, OSError):
+            self._cancel_evaluation()
             self.result_var.set("Error")
+            return
+        
+        if time.monotonic() - self._eval_started > self.time_budget:
+            self._cancel_evaluation()
+            self.result_var.set("Timeout")
+            return
+        
+        self.window.after(EVAL_POLL_MS, self._poll_evaluation, job)
+    
+    def _finish_evaluation(self):
+        """Reset the busy indicator."""
+        self._eval_busy = False
+        self.status_var.set("")
+        self.window.config(cursor="")
+    
+    def _cancel_evaluation(self):
+        """Stop the running evaluation, if any, and replace the worker."""
+        if self._eval_busy:
+            # The worker can't be interrupted mid-expression, so restart it
+            self._stop_worker()
+            self._start_worker()
+        self._finish_evaluation()
+    
+    def _start_worker(self):
+        """Start the long-lived worker process that evaluates expressions."""
+        self._eval_conn, child_conn = multiprocessing.Pipe()
+        self._eval_process = multiprocessing.Process(
+            target=_evaluation_worker, args=(child_conn,), daemon=True
+        )
+        self._eval_process.start()
+        child_conn.close()
+    
+    def _stop_worker(self):
+        """Terminate the worker process and close its pipe."""
+        if self._eval_process is not None:
+            if self._eval_process.is_alive():
+                self._eval_process.terminate()
+            self._eval_process.join(timeout=0.1)
+            self._eval_process = None
+        if self._eval_conn is not None:
+            self._eval_conn.close()
+            self._eval_conn = None
     
     def run(self):
         """Start the GUI application."""
-        self.window.mainloop()
+        try:
+            self.window.mainloop()
+        finally:
+            self._stop_worker()
 
 
 def main():
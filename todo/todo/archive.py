@@ -0,0 +1,75 @@
+"""Archival of completed todos into the todos_archive table."""
+
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import delete, insert, literal, select
+
+from .database import Todo, TodoArchive
+
+ARCHIVED_COLUMNS = ["id", "title", "description", "completed", "created_at", "updated_at"]
+
+
+def archive_completed_todos(
+    session_factory,
+    older_than: timedelta,
+    batch_size: int = 500,
+    on_batch: Optional[Callable[[List[int]], None]] = None,
+) -> List[int]:
+    """
+    Move todos completed more than ``older_than`` ago into the archive.
+    
+    Rows are moved in batches of ``batch_size``, each in its own short
+    transaction, so the hot table is never locked for long. Rows already
+    locked by other transactions are skipped and picked up on a later run.
+    Since todos have no completion timestamp, ``updated_at`` is used as the
+    completion time.
+    
+    Args:
+        session_factory: Callable returning a session bound to the primary
+        older_than: Minimum age of a completed todo before it is archived
+        batch_size: Maximum number of rows moved per transaction
+        on_batch: Called with the ids of each batch right after it commits
+        
+    Returns:
+        Ids of the archived todos
+    """
+    now = datetime.utcnow()
+    cutoff = now - older_than
+    archived: List[int] = []
+    
+    while True:
+        db = session_factory()
+        try:
+            ids = db.scalars(
+                select(Todo.id)
+                .where(Todo.completed.is_(True), Todo.updated_at < cutoff)
+                .order_by(Todo.updated_at, Todo.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not ids:
+                break
+            
+            columns = [getattr(Todo, name) for name in ARCHIVED_COLUMNS] + [literal(now)]
+            db.execute(
+                insert(TodoArchive).from_select(
+                    ARCHIVED_COLUMNS + ["archived_at"],
+                    select(*columns).where(Todo.id.in_(ids)),
+                )
+            )
+            db.execute(delete(Todo).where(Todo.id.in_(ids)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        
+        archived.extend(ids)
+        if on_batch is not None:
+            on_batch(ids)
+        if len(ids) < batch_size:
+            break
+    
+    return archived
@@ -0,0 +1,125 @@
+"""Write coalescing for concurrent todo inserts."""
+
+import asyncio
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+
+class InsertBatcher:
+    """Collect concurrent inserts and flush them as one multi-row INSERT.
+
+    Inserts submitted within ``window`` seconds of the first pending one, or
+    until ``max_batch_size`` are queued, are written in a single transaction
+    with ``INSERT ... RETURNING``. Each caller gets back its own row.
+    """
+
+    def __init__(self, session_factory, model, window: float = 0.005, max_batch_size: int = 64):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.session_factory = session_factory
+        self.model = model
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._batch_sizes: Counter = Counter()
+        self._rows = 0
+        self._failed_batches = 0
+
+    async def submit(self, values: Dict[str, Any]):
+        """Queue a row for insertion and wait for the inserted model instance."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((values, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batch size metrics."""
+        batches = sum(self._batch_sizes.values())
+        batched_rows = sum(size * count for size, count in self._batch_sizes.items())
+        return {
+            "batches": batches,
+            "rows": self._rows,
+            "failed_batches": self._failed_batches,
+            "mean_batch_size": batched_rows / batches if batches else 0.0,
+            "largest_batch": max(self._batch_sizes, default=0),
+            "batch_sizes": {str(size): count for size, count in sorted(self._batch_sizes.items())},
+        }
+
+    def _flush(self):
+        """Hand the pending batch off to a writer task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._write(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Insert a batch and resolve the waiting futures."""
+        try:
+            rows = await run_in_threadpool(self._insert, [values for values, _ in batch])
+        except (IntegrityError, DataError) as e:
+            self._failed_batches += 1
+            if len(batch) > 1:
+                await self._write_each(batch)
+            else:
+                self._fail(batch, e)
+            return
+        except Exception as e:
+            self._failed_batches += 1
+            self._fail(batch, e)
+            return
+
+        self._batch_sizes[len(batch)] += 1
+        self._rows += len(batch)
+        for (_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Dict[str, Any], asyncio.Future]], error: Exception):
+        """Fail every pending future in a batch with the same error."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _write_each(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Insert the rows of a failed batch one at a time."""
+        for values, future in batch:
+            try:
+                rows = await run_in_threadpool(self._insert, [values])
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+
+            self._rows += 1
+            if not future.done():
+                future.set_result(rows[0])
+
+    def _insert(self, values: List[Dict[str, Any]]):
+        """Run the multi-row insert in its own transaction."""
+        db = self.session_factory(expire_on_commit=False)
+        try:
+            statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            rows = db.scalars(statement, values).all()
+            db.commit()
+            return rows
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
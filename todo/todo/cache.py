@@ -0,0 +1,100 @@
+"""In-process caches for the todo application."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry.
+
+    Entries optionally expire ``ttl`` seconds after they were stored.
+    
+    Every ``pop`` bumps the key's invalidation generation. A reader that
+    captures ``generation(key)`` before loading a value can pass it to
+    ``set`` so the value is dropped if the key was invalidated meanwhile.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Last invalidation clock per key; evicted keys fall back to the floor
+        self._generations: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._clock = 0
+        self._generation_floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key and mark it as recently used."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, key: Hashable) -> int:
+        """Return the current invalidation generation of key."""
+        with self._lock:
+            return self._generations.get(key, self._generation_floor)
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store value under key, evicting the oldest entry if full.
+        
+        If ``generation`` is given and key has been invalidated since it was
+        captured, the value is stale and is not stored.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key, self._generation_floor):
+                return
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key if present and bump its invalidation generation."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._clock += 1
+            self._generations[key] = self._clock
+            self._generations.move_to_end(key)
+            if len(self._generations) > self.maxsize:
+                _, self._generation_floor = self._generations.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit, miss and eviction counters."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
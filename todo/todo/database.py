@@ -1,8 +1,9 @@
 """Database models for todo application."""
 
+import itertools
 import os
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import create_engine, Column, Index, Integer, String, Text, Boolean, DateTime
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -18,8 +19,20 @@ if POSTGRES_PASSWORD:
 else:
     DATABASE_URL = f"postgresql://{POSTGRES_USER}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# Optional read replicas, comma separated database URLs
+REPLICA_URLS = [url.strip() for url in os.getenv("TODO_REPLICA_URLS", "").split(",") if url.strip()]
+
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+replica_engines = [
+    create_engine(url, execution_options={"postgresql_readonly": True}) for url in REPLICA_URLS
+]
+ReplicaSessions = [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine, info={"replica": True})
+    for replica_engine in replica_engines
+]
+_replica_counter = itertools.count()
 Base = declarative_base()
 
 
@@ -46,6 +59,35 @@ class Todo(Base):
         }
 
 
+class TodoArchive(Base):
+    """Completed todo moved out of the hot table."""
+    __tablename__ = "todos_archive"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    completed = Column(Boolean, default=True)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Archival scans completed todos by age; partial so active rows aren't indexed
+todos_completed_updated_at_index = Index(
+    "ix_todos_completed_updated_at",
+    Todo.updated_at,
+    Todo.id,
+    postgresql_where=Todo.completed.is_(True),
+    sqlite_where=Todo.completed.is_(True),
+)
+# Archive listing pages by archival time
+todos_archive_archived_at_index = Index(
+    "ix_todos_archive_archived_at_id",
+    TodoArchive.archived_at,
+    TodoArchive.id,
+)
+
+
 def get_db():
     """Get database session."""
     db = SessionLocal()
@@ -55,10 +97,35 @@ def get_db():
         db.close()
 
 
+def read_session_factory(pinned: bool = False):
+    """
+    Pick the session factory for a read.
+    
+    Replicas are used round-robin when configured. Pinned reads, such as
+    those from a client that just wrote, go to the primary. Replica
+    sessions carry ``info["replica"] = True``.
+    """
+    if ReplicaSessions and not pinned:
+        return ReplicaSessions[next(_replica_counter) % len(ReplicaSessions)]
+    return SessionLocal
+
+
+def get_read_db(pinned: bool = False):
+    """Get a read-only database session, from a replica when configured."""
+    db = read_session_factory(pinned)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def create_tables():
     """Create database tables if they don't exist."""
     try:
         Base.metadata.create_all(bind=engine)
+        # create_all skips indexes of tables that already exist
+        for index in (todos_completed_updated_at_index, todos_archive_archived_at_index):
+            index.create(bind=engine, checkfirst=True)
     except Exception as e:
         print(f"Error creating tables: {e}")
         raise
\ No newline at end of file
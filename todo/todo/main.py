@@ -1,18 +1,47 @@
 """FastAPI application for todo management."""
 
+import asyncio
 import os
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
+from functools import lru_cache
 from typing import List
-from fastapi import FastAPI, Depends, Request, Form, HTTPException, status
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Depends, Request, Form, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
-from .database import get_db, create_tables, Todo as TodoModel
-from .models import TodoCreate, TodoUpdate, TodoResponse
+from .archive import archive_completed_todos
+from .batching import InsertBatcher
+from .cache import LRUCache
+from .database import (
+    get_db,
+    get_read_db,
+    read_session_factory,
+    create_tables,
+    SessionLocal,
+    ReplicaSessions,
+    Todo as TodoModel,
+    TodoArchive,
+)
+from .models import TodoCreate, TodoUpdate, TodoResponse, ArchivedTodoResponse, TITLE_MAX_LENGTH
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the archival job, when enabled, for the lifetime of the app."""
+    archiver = asyncio.create_task(_archive_loop()) if ARCHIVE_AFTER_DAYS > 0 else None
+    yield
+    if archiver is not None:
+        archiver.cancel()
+        with suppress(asyncio.CancelledError):
+            await archiver
+
 
 # Create FastAPI app
-app = FastAPI(title="Todo App", description="A simple todo application")
+app = FastAPI(title="Todo App", description="A simple todo application", lifespan=lifespan)
 
 # Setup templates and static files
 templates_dir = os.path.join(os.path.dirname(__file__), "jinja")
@@ -21,6 +50,13 @@ static_dir = os.path.join(os.path.dirname(__file__), "static")
 templates = Jinja2Templates(directory=templates_dir)
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+# Rendered todo-item fragments keyed by (id, updated_at)
+FRAGMENT_CACHE_SIZE = int(os.getenv("TODO_FRAGMENT_CACHE_SIZE", "1024"))
+STREAM_CHUNK_SIZE = 8192
+# Rows fetched per query while streaming the todo list
+STREAM_ROW_BATCH = 100
+fragment_cache = LRUCache(maxsize=FRAGMENT_CACHE_SIZE)
+
 # Create database tables if they don't exist
 try:
     create_tables()
@@ -28,27 +64,182 @@ except Exception as e:
     print(f"Warning: Could not create database tables: {e}")
     print("Please ensure PostgreSQL is running and database 'todo' exists")
 
+# Optional coalescing of concurrent creates into multi-row inserts
+BATCH_WRITES = os.getenv("TODO_BATCH_WRITES", "0") == "1"
+BATCH_WINDOW_MS = float(os.getenv("TODO_BATCH_WINDOW_MS", "5"))
+BATCH_MAX_SIZE = int(os.getenv("TODO_BATCH_MAX_SIZE", "64"))
+
+write_batcher = (
+    InsertBatcher(SessionLocal, TodoModel, window=BATCH_WINDOW_MS / 1000, max_batch_size=BATCH_MAX_SIZE)
+    if BATCH_WRITES
+    else None
+)
+
+# Serialized single-todo payloads keyed by id
+TODO_CACHE_ENABLED = os.getenv("TODO_CACHE", "1") == "1"
+TODO_CACHE_SIZE = int(os.getenv("TODO_CACHE_SIZE", "4096"))
+TODO_CACHE_TTL = float(os.getenv("TODO_CACHE_TTL", "30"))
+
+todo_cache = LRUCache(maxsize=TODO_CACHE_SIZE, ttl=TODO_CACHE_TTL) if TODO_CACHE_ENABLED else None
+
+
+def _invalidate_todo(todo_id: int):
+    """Drop a todo from the read cache after it changes."""
+    if todo_cache is not None:
+        todo_cache.pop(todo_id)
+
+
+# Archival of completed todos (0 days disables the job)
+ARCHIVE_AFTER_DAYS = float(os.getenv("TODO_ARCHIVE_AFTER_DAYS", "0"))
+ARCHIVE_INTERVAL = float(os.getenv("TODO_ARCHIVE_INTERVAL", "3600"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("TODO_ARCHIVE_BATCH_SIZE", "500"))
+
+
+def _invalidate_archived(ids: List[int]):
+    """Drop a committed archive batch from the read cache."""
+    for todo_id in ids:
+        _invalidate_todo(todo_id)
+
+
+async def _archive_loop():
+    """Periodically move old completed todos into the archive table."""
+    while True:
+        try:
+            await run_in_threadpool(
+                archive_completed_todos,
+                SessionLocal,
+                timedelta(days=ARCHIVE_AFTER_DAYS),
+                ARCHIVE_BATCH_SIZE,
+                _invalidate_archived,
+            )
+        except Exception as e:
+            print(f"Warning: Archiving completed todos failed: {e}")
+        await asyncio.sleep(ARCHIVE_INTERVAL)
+
+
+@lru_cache(maxsize=None)
+def _todo_item_macro():
+    """Load the compiled ``todo_item`` macro once and reuse it."""
+    return templates.env.get_template("_todo_item.html").module.todo_item
+
+
+def _wants_fragment(request: Request) -> bool:
+    """Check whether the client asked for an HTML fragment instead of a redirect."""
+    return request.headers.get("HX-Request") == "true"
+
+
+def _cached_todo_item(todo: TodoModel):
+    """Render a todo item, reusing the cached fragment if the row is unchanged."""
+    key = (todo.id, todo.updated_at)
+    fragment = fragment_cache.get(key)
+    if fragment is None:
+        fragment = _todo_item_macro()(todo)
+        fragment_cache.set(key, fragment)
+    return fragment
+
+
+def _render_todo_item(todo: TodoModel) -> HTMLResponse:
+    """Render a single todo item as an HTML fragment."""
+    return HTMLResponse(str(_cached_todo_item(todo)))
+
+
+def _stream_template(name: str, context: dict):
+    """Yield a rendered template in chunks, flushing the first one immediately."""
+    chunks = templates.get_template(name).generate(context)
+    yield next(chunks, "")
+
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+# Seconds a client keeps reading from the primary after it writes (0 disables)
+READ_YOUR_WRITES_SECONDS = int(os.getenv("TODO_READ_YOUR_WRITES", "0"))
+PRIMARY_PIN_COOKIE = "todo_primary_pin"
+
+
+def _is_pinned(request: Request) -> bool:
+    """Check whether the client recently wrote and should read from the primary."""
+    return bool(request.cookies.get(PRIMARY_PIN_COOKIE))
+
+
+def get_read_session(request: Request):
+    """Get a read session, routed to a replica unless the client is pinned."""
+    yield from get_read_db(pinned=_is_pinned(request))
+
+
+async def pin_writers_to_primary(request: Request, call_next):
+    """Send a client's reads to the primary for a while after it writes."""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.set_cookie(PRIMARY_PIN_COOKIE, "1", max_age=READ_YOUR_WRITES_SECONDS, httponly=True)
+    return response
+
+
+if ReplicaSessions and READ_YOUR_WRITES_SECONDS > 0:
+    app.middleware("http")(pin_writers_to_primary)
+
 
 # API Routes
 @app.get("/api/todos", response_model=List[TodoResponse])
-async def get_todos(db: Session = Depends(get_db)):
+async def get_todos(db: Session = Depends(get_read_session)):
     """Get all todos."""
     todos = db.query(TodoModel).all()
     return todos
 
 
+@app.get("/api/todos/archive", response_model=List[ArchivedTodoResponse])
+async def get_archived_todos(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_session),
+):
+    """Get archived todos, most recently archived first."""
+    return (
+        db.query(TodoArchive)
+        .order_by(TodoArchive.archived_at.desc(), TodoArchive.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+
+
 @app.get("/api/todos/{todo_id}", response_model=TodoResponse)
-async def get_todo(todo_id: int, db: Session = Depends(get_db)):
+async def get_todo(todo_id: int, db: Session = Depends(get_read_session)):
     """Get a specific todo."""
+    if todo_cache is not None:
+        payload = todo_cache.get(todo_id)
+        if payload is not None:
+            return JSONResponse(payload)
+        # Captured before the query so a concurrent invalidation wins
+        generation = todo_cache.generation(todo_id)
+
     todo = db.query(TodoModel).filter(TodoModel.id == todo_id).first()
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
+
+    # Replicas may lag behind invalidations, so only primary reads are cached
+    if todo_cache is not None and not db.info.get("replica"):
+        payload = todo.to_dict()
+        todo_cache.set(todo_id, payload, generation=generation)
+        return JSONResponse(payload)
     return todo
 
 
 @app.post("/api/todos", response_model=TodoResponse)
 async def create_todo(todo: TodoCreate, db: Session = Depends(get_db)):
     """Create a new todo."""
+    if write_batcher is not None:
+        return await write_batcher.submit(todo.dict())
+
     db_todo = TodoModel(**todo.dict())
     db.add(db_todo)
     db.commit()
@@ -68,6 +259,7 @@ async def update_todo(todo_id: int, todo_update: TodoUpdate, db: Session = Depen
         setattr(todo, field, value)
     
     db.commit()
+    _invalidate_todo(todo_id)
     db.refresh(todo)
     return todo
 
@@ -81,34 +273,83 @@ async def delete_todo(todo_id: int, db: Session = Depends(get_db)):
     
     db.delete(todo)
     db.commit()
+    _invalidate_todo(todo_id)
     return {"message": "Todo deleted successfully"}
 
 
+@app.get("/api/stats")
+async def get_stats():
+    """Get runtime metrics."""
+    return {
+        "write_batcher": write_batcher.stats() if write_batcher is not None else None,
+        "todo_cache": todo_cache.stats() if todo_cache is not None else None,
+        "fragment_cache": fragment_cache.stats(),
+    }
+
+
 # Web Routes
 @app.get("/", response_class=HTMLResponse)
-async def read_root(request: Request, db: Session = Depends(get_db)):
+async def read_root(request: Request):
     """Render the todo list page."""
-    todos = db.query(TodoModel).all()
-    return templates.TemplateResponse("index.html", {"request": request, "todos": todos})
+    session_factory = read_session_factory(_is_pinned(request))
+    return StreamingResponse(_stream_index(request, session_factory), media_type="text/html")
+
+
+def _stream_index(request: Request, session_factory):
+    """Stream the todo list page, fetching rows only after the header is sent."""
+    context = {"request": request, "todos": _iter_todos(session_factory), "todo_item": _cached_todo_item}
+    yield from _stream_template("index.html", context)
+
+
+def _iter_todos(session_factory):
+    """
+    Yield todos in id order, one keyset page at a time.
+    
+    Each page is read in its own short session, so no connection is held
+    while the response waits on a slow client.
+    """
+    last_id = 0
+    while True:
+        db = session_factory()
+        try:
+            page = (
+                db.query(TodoModel)
+                .filter(TodoModel.id > last_id)
+                .order_by(TodoModel.id)
+                .limit(STREAM_ROW_BATCH)
+                .all()
+            )
+        finally:
+            db.close()
+        
+        yield from page
+        if len(page) < STREAM_ROW_BATCH:
+            return
+        last_id = page[-1].id
 
 
 @app.post("/todos/create")
 async def web_create_todo(
     request: Request,
-    title: str = Form(...),
+    title: str = Form(..., max_length=TITLE_MAX_LENGTH),
     description: str = Form(""),
     db: Session = Depends(get_db)
 ):
     """Create todo via web form."""
     todo = TodoCreate(title=title, description=description)
-    db_todo = TodoModel(**todo.dict())
-    db.add(db_todo)
-    db.commit()
+    if write_batcher is not None:
+        db_todo = await write_batcher.submit(todo.dict())
+    else:
+        db_todo = TodoModel(**todo.dict())
+        db.add(db_todo)
+        db.commit()
+    if _wants_fragment(request):
+        return _render_todo_item(db_todo)
     return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
 
 
 @app.post("/todos/{todo_id}/toggle")
-async def web_toggle_todo(todo_id: int, db: Session = Depends(get_db)):
+async def web_toggle_todo(todo_id: int, request: Request, db: Session = Depends(get_db)):
     """Toggle todo completion status."""
     todo = db.query(TodoModel).filter(TodoModel.id == todo_id).first()
     if not todo:
@@ -116,11 +357,15 @@ async def web_toggle_todo(todo_id: int, db: Session = Depends(get_db)):
     
     todo.completed = not todo.completed
     db.commit()
+    _invalidate_todo(todo_id)
+    if _wants_fragment(request):
+        db.refresh(todo)
+        return _render_todo_item(todo)
     return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
 
 
 @app.post("/todos/{todo_id}/delete")
-async def web_delete_todo(todo_id: int, db: Session = Depends(get_db)):
+async def web_delete_todo(todo_id: int, request: Request, db: Session = Depends(get_db)):
     """Delete todo via web interface."""
     todo = db.query(TodoModel).filter(TodoModel.id == todo_id).first()
     if not todo:
@@ -128,6 +373,9 @@ async def web_delete_todo(todo_id: int, db: Session = Depends(get_db)):
     
     db.delete(todo)
     db.commit()
+    _invalidate_todo(todo_id)
+    if _wants_fragment(request):
+        return HTMLResponse("")
     return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
 
 
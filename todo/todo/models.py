@@ -4,14 +4,20 @@ from datetime import datetime
 from typing import Optional
 
 try:
-    from pydantic import BaseModel
+    from pydantic import BaseModel, Field
 except ImportError:
     BaseModel = object
 
+    def Field(default=None, **kwargs):
+        return default
+
+# Matches the length of the title column
+TITLE_MAX_LENGTH = 200
+
 
 class TodoBase(BaseModel):
     """Base todo model."""
-    title: str
+    title: str = Field(..., max_length=TITLE_MAX_LENGTH)
     description: Optional[str] = None
     completed: bool = False
 
@@ -23,7 +29,7 @@ class TodoCreate(TodoBase):
 
 class TodoUpdate(BaseModel):
     """Todo update model."""
-    title: Optional[str] = None
+    title: Optional[str] = Field(None, max_length=TITLE_MAX_LENGTH)
     description: Optional[str] = None
     completed: Optional[bool] = None
 
@@ -36,4 +42,9 @@ class TodoResponse(TodoBase):
     
     if hasattr(BaseModel, 'Config'):
         class Config:
-            from_attributes = True
\ No newline at end of file
+            from_attributes = True
+
+
+class ArchivedTodoResponse(TodoResponse):
+    """Archived todo response model."""
+    archived_at: datetime
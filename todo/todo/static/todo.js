@@ -0,0 +1,55 @@
+/* Progressive enhancement: submit todo forms in the background and swap
+   in the HTML fragment returned by the server instead of reloading. */
+
+function swapFragment(form, mode, html) {
+    if (mode === "append") {
+        const list = document.querySelector(".todo-list");
+        const empty = list.querySelector(".empty-state");
+        if (empty) {
+            empty.remove();
+        }
+        list.insertAdjacentHTML("beforeend", html);
+        form.reset();
+    } else if (mode === "replace") {
+        const item = form.closest(".todo-item");
+        if (html) {
+            item.outerHTML = html;
+        } else {
+            item.remove();
+        }
+    }
+}
+
+document.addEventListener("submit", async (event) => {
+    const form = event.target;
+    const mode = form.dataset.fragment;
+    if (!mode || !window.fetch) {
+        return;
+    }
+    event.preventDefault();
+
+    let html;
+    try {
+        const response = await fetch(form.action, {
+            method: "POST",
+            body: new FormData(form),
+            headers: { "HX-Request": "true" },
+        });
+        if (!response.ok) {
+            window.location.reload();
+            return;
+        }
+        html = (await response.text()).trim();
+    } catch (error) {
+        // Request never completed: fall back to a plain form post
+        form.submit();
+        return;
+    }
+
+    try {
+        swapFragment(form, mode, html);
+    } catch (error) {
+        // The write went through, so reload rather than posting it again
+        window.location.reload();
+    }
+});